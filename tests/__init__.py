@@ -1,19 +1,66 @@
 import ast
-import contextlib
+import concurrent.futures
 import copy
 import dataclasses
+import datetime
+import hashlib
+import importlib.metadata
 import os
 import pathlib
 import re
-import shlex
 import shutil
 import subprocess
+import tempfile
+import uuid
 import venv
 
+import tomlkit
 from cookiecutter.main import cookiecutter
 
 PACKAGE_DIR = "test_package"
 VENV_DIR = "package_venv"
+SYNC_STAMP = ".pip-sync-stamp"
+
+PIP_ENVIRONMENT = {
+    "PIP_DISABLE_PIP_VERSION_CHECK": "1",
+    "PIP_NO_PYTHON_VERSION_WARNING": "1",
+}
+"""
+Environment variables for pip, when running from a virtual environment.
+"""
+
+COOKIECUTTER_PATH = pathlib.Path(__file__).resolve().parent.parent
+COOKIECUTTER_SOURCES = (
+    "cookiecutter.json",
+    "hooks",
+    "{{cookiecutter.__project_slug}}",
+)
+LICENSE_YEAR_RE = re.compile(r"^Copyright \(c\) (?P<year>\d{4})")
+
+RENDER_CACHE_DIR = (
+    pathlib.Path(os.environ.get("XDG_CACHE_HOME", pathlib.Path.home() / ".cache"))
+    / "pybase-tests"
+)
+
+_cleanup_pool = concurrent.futures.ThreadPoolExecutor(max_workers=2)
+"""
+Threads deleting directory trees, in the background. See delete_tree().
+The executor joins its threads at interpreter exit, so pending deletions are
+waited for.
+"""
+
+_pyproject_cache = {}
+"""
+Parsed pyproject.toml files, keyed by path. Each entry holds the stamp of the
+file it was parsed from, along with the parsed document.
+"""
+
+_project_info_cache = {}
+"""
+Information extracted from pyproject.toml files, by get_project_info(), keyed
+by path. Each entry holds the stamp of the file it was extracted from, along
+with the information itself.
+"""
 
 
 @dataclasses.dataclass
@@ -22,42 +69,29 @@ class Package:
     venv: pathlib.Path
 
 
-@contextlib.contextmanager
-def run_from(path):
-    """
-    Context manager to run code from a given path.
-
-    When done, go back to the original working directory.
-
-    Virtually none of the functions defined in this file call this, so the
-    caller is expected to run them from a run_from() context. In practice, the
-    test suite does that for you, via an autouse fixture.
-
-    Args:
-        path (str | pathlib.Path): Path to run from.
-    """
-
-    original_path = pathlib.Path.cwd().resolve()
-    target_path = pathlib.Path(path).resolve()
-
-    os.chdir(target_path)
-    yield
-    os.chdir(original_path)
-
-
-def run_cmd(cmd, *args, venv=None):
+def run_cmd(cmd, *args, venv=None, cwd=None):
     """
     Run the given command, with the provided arguments, optionally from a
     specific virtual environment.
 
     Runs the command using subprocess.run(), in check and capture mode: all
-    process output is stored, and it will raise on non-zero exit code.
+    process output is stored, decoded as text, and it will raise on non-zero
+    exit code. No shell is involved: the command and its arguments are passed
+    as they are.
+
+    Commands found in the virtual environment bin/ directory are run from
+    there, without going through a PATH lookup. The virtual environment is
+    still put first in PATH, for any process the command spawns, VIRTUAL_ENV
+    points to it, and pip is configured via PIP_ENVIRONMENT.
 
     Args:
         cmd (str): Command to run.
         args (list[str]): Arguments to pass to the command.
         venv (str | pathlib.Path, optional): Virtual environment to run the
                                              command from. Defaults to None.
+        cwd (str | pathlib.Path, optional): Working directory to run the
+                                            command from. Defaults to None,
+                                            meaning the current one.
 
     Returns:
         subprocess.CompletedProcess: The return value from subprocess.run(),
@@ -68,27 +102,58 @@ def run_cmd(cmd, *args, venv=None):
                                        exit code, stdout and stderr.
     """
 
-    command = shlex.join([cmd, *args])
-    environment = copy.deepcopy(os.environ)
+    environment = None
 
     if venv:
-        venv_bin = pathlib.Path(venv).resolve() / "bin"
-        environment["PATH"] = ":".join(
-            [
-                str(venv_bin),
-                *environment["PATH"].split(":"),
-            ]
-        )
+        venv_loc = pathlib.Path(venv).resolve()
+        venv_bin = venv_loc / "bin"
+
+        environment = {
+            **os.environ,
+            **PIP_ENVIRONMENT,
+            "PATH": os.pathsep.join([str(venv_bin), os.environ["PATH"]]),
+            "VIRTUAL_ENV": str(venv_loc),
+        }
+
+        venv_cmd = venv_bin / cmd
+        if venv_cmd.is_file():
+            cmd = str(venv_cmd)
 
     return subprocess.run(
-        command,
+        [cmd, *args],
         env=environment,
+        cwd=cwd,
         check=True,
-        shell=True,
         capture_output=True,
+        text=True,
     )
 
 
+def delete_tree(path):
+    """
+    Delete a directory tree, in the background.
+
+    Deleting a virtual environment means deleting thousands of files, so it's
+    left to a background thread. The tree is renamed first, which is atomic,
+    so the path is free to be reused as soon as this returns. Any pending
+    deletions are waited for at interpreter exit.
+
+    Args:
+        path (str | pathlib.Path): Directory to delete. It's fine if it does not
+                                   exist.
+    """
+
+    path = pathlib.Path(path)
+    doomed = path.with_name(f"{path.name}.deleting.{uuid.uuid4().hex}")
+
+    try:
+        os.rename(path, doomed)
+    except FileNotFoundError:
+        return
+
+    _cleanup_pool.submit(shutil.rmtree, doomed, ignore_errors=True)
+
+
 def delete_package(package):
     """
     Delete a previously created Python package, and its associated virtual
@@ -98,24 +163,133 @@ def delete_package(package):
         package (Package): Package to delete.
     """
 
-    shutil.rmtree(package.package, ignore_errors=True)
-    shutil.rmtree(package.venv, ignore_errors=True)
+    delete_tree(package.package)
+    delete_tree(package.venv)
+
+
+def _cookiecutter_stamp():
+    """
+    Identify the current state of the Cookiecutter template on disk.
+
+    Returns:
+        int: Latest modification time, in nanoseconds, of any of the template
+             files and directories.
+    """
+
+    stamp = 0
+
+    for source in COOKIECUTTER_SOURCES:
+        source_path = COOKIECUTTER_PATH / source
+        stamp = max(stamp, source_path.stat().st_mtime_ns)
+
+        for root, dirs, files in os.walk(source_path):
+            for name in (*dirs, *files):
+                stamp = max(stamp, os.stat(os.path.join(root, name)).st_mtime_ns)
+
+    return stamp
+
+
+def _formatter_versions():
+    """
+    Identify the formatters the template post-generation hook runs.
+
+    Returns:
+        tuple[str | None, ...]: Installed versions of Black and isort, or None
+                                for any of them not installed.
+    """
+
+    versions = []
+
+    for formatter in ("black", "isort"):
+        try:
+            versions.append(importlib.metadata.version(formatter))
+        except importlib.metadata.PackageNotFoundError:
+            versions.append(None)
+
+    return tuple(versions)
+
 
+def render_package(target, **context):
+    """
+    Render the Cookiecutter template into a new package.
+
+    Rendering involves reading the whole template, and running the post-
+    generation hook, which formats the result. The output is cached on disk,
+    under RENDER_CACHE_DIR, so Cookiecutter only runs again once something it
+    depends on changes. The cache is split in generations, keyed by the state
+    of the template and the formatters, each holding one rendered package per
+    context. Only the current generation is kept: older ones are pruned
+    whenever a new package is rendered. The cached output is then copied into
+    the target: it's not hard-linked, as package files are modified in place.
 
-def create_package(target, **context):
+    Args:
+        target (str | pathlib.Path): Directory where the package will be
+                                     rendered.
+        context (dict[str, str]): Context to provide to Cookiecutter on package
+                                  creation.
+    """
+
+    # The template renders the current year into LICENSE.
+    generation_key = repr(
+        (
+            _cookiecutter_stamp(),
+            datetime.date.today().year,
+            _formatter_versions(),
+        )
+    )
+    context_key = repr(sorted(context.items()))
+
+    generation = (
+        RENDER_CACHE_DIR / hashlib.sha256(generation_key.encode("utf-8")).hexdigest()
+    )
+    rendered = generation / hashlib.sha256(context_key.encode("utf-8")).hexdigest()
+
+    if not rendered.exists():
+        generation.mkdir(parents=True, exist_ok=True)
+
+        for entry in RENDER_CACHE_DIR.iterdir():
+            if entry != generation:
+                shutil.rmtree(entry, ignore_errors=True)
+
+        output_dir = tempfile.mkdtemp(dir=generation)
+
+        try:
+            cookiecutter(
+                str(COOKIECUTTER_PATH),
+                output_dir=output_dir,
+                no_input=True,
+                extra_context=context,
+            )
+
+            try:
+                os.rename(output_dir, rendered)
+            except OSError:
+                # Somebody else rendered the same package in the meantime.
+                pass
+        finally:
+            shutil.rmtree(output_dir, ignore_errors=True)
+
+    shutil.copytree(rendered / PACKAGE_DIR, pathlib.Path(target) / PACKAGE_DIR)
+
+
+def create_package(target, base_venv=None, **context):
     """
     Create a Cookiecut Python package.
 
     Performs the following steps:
 
     - Ensure the target is empty.
-    - Call Cookiecutter, with the provided context, to create the package.
-    - Create a virtual environment.
+    - Render the package, with the provided context, using Cookiecutter.
+    - Create a virtual environment, or clone the base one, if provided.
     - Run the bootstrap script.
 
     Args:
         target (str | pathlib.Path): Directory where the package and virtual
                                      environment will be created.
+        base_venv (str | pathlib.Path, optional): Virtual environment to clone,
+                                                  as created by
+                                                  create_base_venv(). Defaults
+                                                  to None.
         context (dict[str, str]): Context to provide to Cookiecutter on package
                                   creation.
 
@@ -131,22 +305,160 @@ def create_package(target, **context):
     )
 
     delete_package(package)
+    render_package(target_loc, **context)
+
+    if base_venv:
+        clone_venv(base_venv, target_loc)
+    else:
+        virtualenv = venv.EnvBuilder(clear=True, with_pip=True, upgrade_deps=True)
+        virtualenv.create(package.venv)
+
+    run_cmd("./scripts/bootstrap.sh", venv=package.venv, cwd=package.package)
+
+    # The bootstrap script syncs the development requirements.
+    _write_sync_stamp(package, _dev_requirements_digest(package))
+
+    return package
+
+
+def relocate_venv(venv_path, old_root, new_root):
+    """
+    Rewrite the absolute paths a virtual environment holds.
+
+    Virtual environments are not meant to be moved around: the paths to the
+    environment, and to any package installed in editable mode, are hard-coded
+    in the scripts under bin/, in pyvenv.cfg, and in the top-level files of
+    site-packages (.pth files, editable finders and the like). This replaces
+    the old root with the new one in all of them.
+
+    Files are unlinked before being rewritten, so hard links to the original
+    environment are broken, instead of written through.
 
-    cookiecutter_path = pathlib.Path(__file__).parent.parent
-    cookiecutter(
-        str(cookiecutter_path),
-        output_dir=target,
-        no_input=True,
-        extra_context=context,
+    Args:
+        venv_path (str | pathlib.Path): Virtual environment to rewrite.
+        old_root (str | pathlib.Path): Root the environment was created under.
+        new_root (str | pathlib.Path): Root the environment now lives under.
+    """
+
+    venv_path = pathlib.Path(venv_path)
+    old_prefix = f"{old_root}{os.sep}"
+    new_prefix = f"{new_root}{os.sep}"
+
+    candidates = (
+        venv_path / "pyvenv.cfg",
+        *(venv_path / "bin").iterdir(),
+        *venv_path.glob("lib/python*/site-packages/*"),
+        *venv_path.glob("lib/python*/site-packages/*.dist-info/direct_url.json"),
     )
 
+    for path in candidates:
+        if path.is_symlink() or not path.is_file():
+            continue
+
+        try:
+            content = path.read_text()
+        except UnicodeDecodeError:
+            continue
+
+        if old_prefix not in content:
+            continue
+
+        mode = path.stat().st_mode
+        path.unlink()
+        path.write_text(content.replace(old_prefix, new_prefix))
+        path.chmod(mode)
+
+
+def create_base_venv(target):
+    """
+    Create a virtual environment holding the base package toolchain.
+
+    Creating a virtual environment with an up-to-date pip, and installing the
+    tools the bootstrap script relies on, is the slowest part of creating one.
+    Create it once, and clone it for every package, via the base_venv argument
+    of create_package().
+
+    Args:
+        target (str | pathlib.Path): Directory where the virtual environment
+                                     will be created.
+
+    Returns:
+        pathlib.Path: Location of the virtual environment.
+    """
+
+    venv_path = pathlib.Path(target).resolve() / VENV_DIR
+
     virtualenv = venv.EnvBuilder(clear=True, with_pip=True, upgrade_deps=True)
-    virtualenv.create(package.venv)
+    virtualenv.create(venv_path)
 
-    with run_from(package.package):
-        run_cmd("./scripts/bootstrap.sh", venv=package.venv)
+    run_cmd("pip", "install", "-U", "setuptools", "wheel", "pip-tools", venv=venv_path)
 
-    return package
+    return venv_path
+
+
+def clone_venv(venv_path, target):
+    """
+    Clone a virtual environment.
+
+    The virtual environment is hard-linked, which is safe as pip never writes
+    through existing files, and then relocated.
+
+    Args:
+        venv_path (str | pathlib.Path): Virtual environment to clone.
+        target (str | pathlib.Path): Directory where the cloned virtual
+                                     environment will be created.
+
+    Returns:
+        pathlib.Path: Location of the cloned virtual environment.
+    """
+
+    venv_path = pathlib.Path(venv_path).resolve()
+    target_loc = pathlib.Path(target).resolve()
+    clone = target_loc / VENV_DIR
+
+    delete_tree(clone)
+    shutil.copytree(venv_path, clone, symlinks=True, copy_function=os.link)
+
+    relocate_venv(clone, venv_path.parent, target_loc)
+
+    return clone
+
+
+def clone_package(package, target):
+    """
+    Clone a previously created package, and its associated virtual
+    environment.
+
+    Creating a package from scratch is expensive: it involves creating a
+    virtual environment, and installing all of the package requirements. It's
+    much cheaper to create it once, and clone it for every consumer which
+    needs a pristine package.
+
+    The package itself is copied, as tests are free to modify its files in
+    place. The virtual environment is cloned, via clone_venv().
+
+    Args:
+        package (Package): Package to clone.
+        target (str | pathlib.Path): Directory where the cloned package and
+                                     virtual environment will be created.
+
+    Returns:
+        Package: Structure containing the location of the cloned package and
+                 its associated virtual environment.
+    """
+
+    target_loc = pathlib.Path(target).resolve()
+    clone = Package(
+        package=target_loc / PACKAGE_DIR,
+        venv=target_loc / VENV_DIR,
+    )
+
+    delete_package(clone)
+
+    shutil.copytree(package.package, clone.package, symlinks=True)
+    clone_venv(package.venv, target_loc)
+
+    return clone
 
 
 def gen_requirements(package):
@@ -157,7 +469,42 @@ def gen_requirements(package):
         package (Package): The target package.
     """
 
-    run_cmd("./scripts/gen_requirements.sh", venv=package.venv)
+    run_cmd("./scripts/gen_requirements.sh", venv=package.venv, cwd=package.package)
+
+
+def _dev_requirements_digest(package):
+    """
+    Hash the pinned development requirements of a package.
+
+    Args:
+        package (Package): The target package.
+
+    Returns:
+        str: SHA-256 hex digest of requirements/dev.txt.
+    """
+
+    requirements_path = package.package / "requirements/dev.txt"
+
+    return hashlib.sha256(requirements_path.read_bytes()).hexdigest()
+
+
+def _write_sync_stamp(package, digest):
+    """
+    Record the development requirements a virtual environment was synced to.
+
+    The stamp is unlinked before being written, so hard links to a cloned
+    virtual environment are broken, instead of written through.
+
+    Args:
+        package (Package): The target package.
+        digest (str): Digest of the synced requirements, as returned by
+                      _dev_requirements_digest().
+    """
+
+    stamp_path = package.venv / SYNC_STAMP
+
+    stamp_path.unlink(missing_ok=True)
+    stamp_path.write_text(digest, encoding="utf-8")
 
 
 def install_dev_requirements(package):
@@ -169,58 +516,164 @@ def install_dev_requirements(package):
     - All pinned requirements defined in requirements/dev.txt.
     - The package itself, in editable mode.
 
+    The virtual environment keeps a stamp of the requirements it was last
+    synced to, so pip-sync only runs if they have changed since.
+
     Args:
         package (Package): The target package.
     """
 
-    run_cmd("pip-sync", "requirements/dev.txt", venv=package.venv)
-    run_cmd("pip", "install", "-e", ".[dev]", venv=package.venv)
+    digest = _dev_requirements_digest(package)
+    stamp_path = package.venv / SYNC_STAMP
+
+    if not stamp_path.exists() or stamp_path.read_text(encoding="utf-8") != digest:
+        run_cmd(
+            "pip-sync",
+            "requirements/dev.txt",
+            venv=package.venv,
+            cwd=package.package,
+        )
+        _write_sync_stamp(package, digest)
 
+    run_cmd("pip", "install", "-e", ".[dev]", venv=package.venv, cwd=package.package)
 
-def add_dependency(dependency, package):
+
+def _pyproject_stamp(pyproject_path):
+    """
+    Identify the current state of a pyproject.toml file on disk.
+
+    Args:
+        pyproject_path (pathlib.Path): Path to the pyproject.toml file.
+
+    Returns:
+        tuple[int, int]: Modification time, in nanoseconds, and size.
     """
-    Declare a new dependency for a package.
 
-    Parses setup.py and appends a new dependency to "install_requires",
-    using a subclass of ast.NodeTransformer.
+    pyproject_stat = pyproject_path.stat()
+
+    return pyproject_stat.st_mtime_ns, pyproject_stat.st_size
+
+
+def _load_pyproject(package):
+    """
+    Parse a package pyproject.toml.
+
+    The parsed document is cached, and only parsed again once the file changes
+    on disk. Callers are free to modify the document in place, as long as they
+    store it back via _store_pyproject().
+
+    Args:
+        package (Package): The target package.
+
+    Returns:
+        tomlkit.TOMLDocument: The parsed pyproject.toml.
+    """
+
+    pyproject_path = package.package / "pyproject.toml"
+    stamp = _pyproject_stamp(pyproject_path)
+
+    cached = _pyproject_cache.get(pyproject_path)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+
+    pyproject = tomlkit.parse(pyproject_path.read_text(encoding="utf-8"))
+
+    _pyproject_cache[pyproject_path] = (stamp, pyproject)
+
+    return pyproject
+
+
+def _store_pyproject(package, pyproject):
+    """
+    Write a parsed pyproject.toml back to disk, keeping it cached.
+
+    The file is left untouched if its contents would not change. Information
+    previously extracted from it is dropped: the file stamp alone can't tell a
+    same-size rewrite within one modification time tick apart.
 
     Args:
-        dependency (str): Dependency to add, following PEP-440.
         package (Package): The target package.
+        pyproject (tomlkit.TOMLDocument): The pyproject.toml document to write.
+    """
+
+    pyproject_path = package.package / "pyproject.toml"
+    pyproject_text = tomlkit.dumps(pyproject)
+
+    if pyproject_text != pyproject_path.read_text(encoding="utf-8"):
+        pyproject_path.write_text(pyproject_text, encoding="utf-8")
+
+    _pyproject_cache[pyproject_path] = (_pyproject_stamp(pyproject_path), pyproject)
+    _project_info_cache.pop(pyproject_path, None)
+
+
+def _find_project(pyproject):
     """
+    Find the [project] table in a parsed pyproject.toml.
 
-    class DependencyAdder(ast.NodeTransformer):
-        def visit_keyword(self, node):
-            if node.arg == "install_requires":
-                return ast.keyword(
-                    arg=node.arg,
-                    value=ast.List(
-                        elts=[
-                            *node.value.elts,
-                            ast.Constant(value=dependency),
-                        ],
-                        ctx=node.value.ctx,
-                    ),
-                )
+    Args:
+        pyproject (tomlkit.TOMLDocument): The parsed pyproject.toml.
 
-            return node
+    Returns:
+        tomlkit.items.Table: The [project] table.
 
-    setup_path = package.package / "setup.py"
+    Raises:
+        ValueError: If pyproject.toml has no [project] table.
+    """
 
-    with open(setup_path, "r") as setup_file:
-        setup = ast.parse(setup_file.read())
-        new_setup = ast.fix_missing_locations(DependencyAdder().visit(setup))
+    project = pyproject.get("project")
 
-    with open(setup_path, "w") as setup_file:
-        setup_file.write(ast.unparse(new_setup))
+    if project is None:
+        raise ValueError("pyproject.toml has no [project] table")
+
+    return project
+
+
+def add_dependencies(dependencies, package):
+    """
+    Declare new dependencies for a package.
+
+    Parses pyproject.toml and appends the new dependencies to "dependencies",
+    in the [project] table. pyproject.toml is written only once, no matter how
+    many dependencies are added.
+
+    Args:
+        dependencies (Iterable[str]): Dependencies to add, following PEP-440.
+        package (Package): The target package.
+    """
+
+    new_deps = list(dependencies)
+
+    if not new_deps:
+        return
+
+    pyproject = _load_pyproject(package)
+
+    _find_project(pyproject)["dependencies"].extend(new_deps)
+
+    _store_pyproject(package, pyproject)
+
+
+def add_dependency(dependency, package):
+    """
+    Declare a new dependency for a package.
+
+    See add_dependencies().
+
+    Args:
+        dependency (str): Dependency to add, following PEP-440.
+        package (Package): The target package.
+    """
+
+    add_dependencies([dependency], package)
 
 
 def update_dependency(old, new, package):
     """
     Declare an updated dependency for a package.
 
-    Parses setup.py, looks for the old dependency in "install_requires", and
-    replaces it with the new version.
+    Parses pyproject.toml, looks for the old dependency in "dependencies", and
+    replaces it with the new version. If the old dependency is not there,
+    pyproject.toml is left untouched.
 
     Args:
         old (str): Dependency to replace, following PEP-440.
@@ -228,64 +681,70 @@ def update_dependency(old, new, package):
         package (Package): The target package.
     """
 
-    class DependencyUpdater(ast.NodeTransformer):
-        def visit_keyword(self, node):
-            if node.arg == "install_requires":
-                new_deps = []
-                for elt in node.value.elts:
-                    if elt.value == old:
-                        new_deps.append(ast.Constant(value=new))
-                    else:
-                        new_deps.append(elt)
+    pyproject = _load_pyproject(package)
+    deps = _find_project(pyproject)["dependencies"]
+    changed = False
 
-                return ast.keyword(
-                    arg=node.arg,
-                    value=ast.List(
-                        elts=new_deps,
-                        ctx=node.value.ctx,
-                    ),
-                )
+    for index, dep in enumerate(deps):
+        if dep == old:
+            deps[index] = new
+            changed = True
 
-            return node
+    if changed:
+        _store_pyproject(package, pyproject)
 
-    setup_path = package.package / "setup.py"
 
-    with open(setup_path, "r") as setup_file:
-        setup = ast.parse(setup_file.read())
-        new_setup = ast.fix_missing_locations(DependencyUpdater().visit(setup))
-
-    with open(setup_path, "w") as setup_file:
-        setup_file.write(ast.unparse(new_setup))
-
-
-def add_and_install_dependency(dependency, package):
+def add_and_install_dependencies(dependencies, package):
     """
-    Declare and install a new dependency for a package.
+    Declare and install new dependencies for a package.
 
     Performs the following steps:
 
-    - Adds the new dependency to setup.py.
+    - Adds the new dependencies to pyproject.toml.
     - Regenerates the pinned requirements files, using pip-tools.
     - Installs the pinned development requirements, and the package, in
       editable mode.
 
+    Requirements are generated and installed only once, no matter how many
+    dependencies are added, so prefer this over repeated calls to
+    add_and_install_dependency(). Nothing is done for an empty batch.
+
     Args:
-        dependency (str): Dependency to add, following PEP-440.
+        dependencies (Iterable[str]): Dependencies to add, following PEP-440.
         package (Package): The target package.
     """
 
-    add_dependency(dependency, package)
+    dependencies = list(dependencies)
+
+    if not dependencies:
+        return
+
+    add_dependencies(dependencies, package)
     gen_requirements(package)
     install_dev_requirements(package)
 
 
+def add_and_install_dependency(dependency, package):
+    """
+    Declare and install a new dependency for a package.
+
+    See add_and_install_dependencies().
+
+    Args:
+        dependency (str): Dependency to add, following PEP-440.
+        package (Package): The target package.
+    """
+
+    add_and_install_dependencies([dependency], package)
+
+
 def update_and_install_dependency(old, new, package):
     """
     Declare and install an updated dependency for a package.
 
     Performs the following steps:
 
-    - Updates the dependency in setup.py.
+    - Updates the dependency in pyproject.toml.
     - Regenerates the pinned requirements files, using pip-tools.
     - Installs the pinned development requirements, and the package, in
       editable mode.
@@ -297,17 +756,66 @@ def update_and_install_dependency(old, new, package):
     """
 
     update_dependency(old, new, package)
-    run_cmd("./scripts/update_requirements.sh", new, venv=package.venv)
+    run_cmd(
+        "./scripts/update_requirements.sh",
+        new,
+        venv=package.venv,
+        cwd=package.package,
+    )
     install_dev_requirements(package)
 
 
-def get_meta(package):
+def get_project_info(package):
     """
-    Extract meta information from a package setup.py.
+    Extract meta and dependency information from a package pyproject.toml.
+
+    Extracts the information from the [project] table, which holds the static
+    package metadata. Both kinds of information are gathered from the same
+    parsed document.
+
+    See get_meta() and get_dependencies() for the structure of each.
+
+    Results are cached until pyproject.toml changes on disk. Callers get their
+    own copy, which they are free to modify.
 
-    Extracts the information from the call to setup(), using a subclass of
-    ast.NodeVisitor. This roundabout way is meant to avoid the perils of
-    importing setup.py.
+    Args:
+        package (Package): The target package.
+
+    Returns:
+        tuple[dict[str, str], dict[list[str], dict[str, list[str]]]]: Meta and
+            dependency information extracted from pyproject.toml.
+    """
+
+    pyproject_path = package.package / "pyproject.toml"
+    pyproject = _load_pyproject(package)
+    stamp, _ = _pyproject_cache[pyproject_path]
+
+    cached = _project_info_cache.get(pyproject_path)
+    if cached is not None and cached[0] == stamp:
+        return copy.deepcopy(cached[1])
+
+    project = _find_project(pyproject).unwrap()
+    author = (project.get("authors") or [{}])[0]
+
+    meta = {
+        "name": project.get("name"),
+        "version": project.get("version"),
+        "author": author.get("name"),
+        "author_email": author.get("email"),
+    }
+    dependencies = {
+        "install": project.get("dependencies", []),
+        "extras": project.get("optional-dependencies", {}),
+    }
+
+    _project_info_cache[pyproject_path] = (stamp, (meta, dependencies))
+
+    return copy.deepcopy((meta, dependencies))
+
+
+def get_meta(package):
+    """
+    Extract meta information from a package pyproject.toml.
 
     The keys it returns are:
 
@@ -320,32 +828,17 @@ def get_meta(package):
         package (Package): The target package.
 
     Returns:
-        dict[str, str]: Information extracted from setup.py.
+        dict[str, str]: Information extracted from pyproject.toml.
     """
 
-    meta = {}
-
-    class MetaVisitor(ast.NodeVisitor):
-        def visit_keyword(self, node):
-            if node.arg in ("name", "version", "author", "author_email"):
-                meta[node.arg] = node.value.value
-
-    setup_path = package.package / "setup.py"
-
-    with open(setup_path, "r") as setup_file:
-        setup = ast.parse(setup_file.read())
-        MetaVisitor().visit(setup)
+    meta, _ = get_project_info(package)
 
     return meta
 
 
 def get_dependencies(package):
     """
-    Extract dependency information from a package setup.py.
-
-    Extracts the dependency lists from the call to setup(), using a subclass of
-    ast.NodeVisitor. This roundabout way is meant to avoid the perils of
-    importing setup.py.
+    Extract dependency information from a package pyproject.toml.
 
     Returns a dictionary, with two keys:
 
@@ -358,38 +851,15 @@ def get_dependencies(package):
 
     Returns:
         dict[list[str], dict[str, list[str]]]: Dependency information extracted
-                                               from setup.py.
+                                               from pyproject.toml.
     """
 
-    dependencies = {
-        "install": [],
-        "extras": {},
-    }
-
-    class DependenciesVisitor(ast.NodeVisitor):
-        def visit_keyword(self, node):
-            if node.arg == "install_requires":
-                deps = node.value.elts
-                dependencies["install"] = [dep.value for dep in deps]
-
-            if node.arg == "extras_require":
-                groups = node.value
-
-                for key, value in zip(groups.keys, groups.values):
-                    name = key.value
-                    deps = value.elts
-                    dependencies["extras"][name] = [dep.value for dep in deps]
-
-    setup_path = package.package / "setup.py"
-
-    with open(setup_path, "r") as setup_file:
-        setup = ast.parse(setup_file.read())
-        DependenciesVisitor().visit(setup)
+    _, dependencies = get_project_info(package)
 
     return dependencies
 
 
-def get_current_version():
+def get_current_version(package):
     """
     Fetch the current package version.
 
@@ -400,20 +870,29 @@ def get_current_version():
     - For other consumers, a plain-text VERSION file.
 
     We retrieve both, ensure they contain the exact same information, and
-    return the value.
+    return the value. __init__.py is parsed, rather than executed.
+
+    Args:
+        package (Package): The target package.
 
     Returns:
         str: The current Python package version.
     """
 
-    with open("src/test_package/__init__.py") as package_init:
-        ns = {}
-        exec(package_init.read(), ns)
+    init_path = package.package / "src/test_package/__init__.py"
+    init = ast.parse(init_path.read_text(encoding="utf-8"))
 
-        py_version = ns["__version__"]
+    py_version = None
 
-    with open("VERSION", "r") as version_file:
-        plaintext_version = version_file.read().strip()
+    for node in init.body:
+        if isinstance(node, ast.Assign) and any(
+            isinstance(target, ast.Name) and target.id == "__version__"
+            for target in node.targets
+        ):
+            py_version = node.value.value
+
+    version_path = package.package / "VERSION"
+    plaintext_version = version_path.read_text(encoding="utf-8").strip()
 
     assert py_version == plaintext_version
 
@@ -435,23 +914,30 @@ def get_bumpver_info(package):
         dict[str, str]: The information extracted from BumpVer.
     """
 
-    result = run_cmd("bumpver", "show", "-ne", venv=package.venv)
-    output = result.stdout.decode("utf-8").strip()
+    result = run_cmd(
+        "bumpver",
+        "show",
+        "-ne",
+        venv=package.venv,
+        cwd=package.package,
+    )
+    output = result.stdout.strip()
 
-    return dict(line.split("=") for line in output.split("\n"))
+    return dict(line.partition("=")[::2] for line in output.splitlines())
 
 
-def get_license_year():
+def get_license_year(package):
     """
     Read the copyright year from the LICENSE file.
 
+    Args:
+        package (Package): The target package.
+
     Returns:
         str: The license year.
     """
 
-    with open("LICENSE", "r") as license_file:
-        license = license_file.read()
-
-    match = re.match(r"^Copyright \(c\) (?P<year>\d{4})", license)
+    license_path = package.package / "LICENSE"
+    match = LICENSE_YEAR_RE.match(license_path.read_text(encoding="utf-8"))
 
     return match.group("year")
@@ -1,9 +1,38 @@
+import contextlib
+import fcntl
+import hashlib
+
 import pytest
 
-from . import create_package, delete_package, run_from
+from . import (
+    PACKAGE_DIR,
+    VENV_DIR,
+    Package,
+    clone_package,
+    create_base_venv,
+    create_package,
+    delete_package,
+)
 
 
-@pytest.fixture
+@contextlib.contextmanager
+def locked(path):
+    """
+    Context manager to hold an exclusive lock on a path.
+
+    The lock is taken on a sibling lock file, so the path itself does not need
+    to exist. It's meant to guard resources shared by pytest-xdist workers.
+
+    Args:
+        path (pathlib.Path): Path to lock.
+    """
+
+    with open(path.with_name(f"{path.name}.lock"), "w") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        yield
+
+
+@pytest.fixture(scope="session")
 def context():
     return {
         "full_name": "John Doe",
@@ -13,23 +42,99 @@ def context():
     }
 
 
-@pytest.fixture
-def package(context, tmp_path):
+@pytest.fixture(scope="session")
+def shared_tmp_path(tmp_path_factory, worker_id):
     """
-    Create a new package, in a temporary directory, given the configuration
-    given by the "context" fixture. Once done, clean it up.
+    Temporary directory for session-wide resources.
+
+    Under pytest-xdist, every worker runs its own session. The directory is
+    then the one all workers share, so the resources created there are still
+    created only once. Since no worker knows when the others are done with
+    them, it's left for pytest to clean up, along with the rest of its
+    temporary directories.
+
+    Resources created there must be guarded with locked().
     """
 
-    package = create_package(target=tmp_path, **context)
-    yield package
-    delete_package(package)
+    if worker_id == "master":
+        return tmp_path_factory.getbasetemp()
 
+    return tmp_path_factory.getbasetemp().parent
 
-@pytest.fixture(autouse=True)
-def run_from_package(package):
+
+@pytest.fixture(scope="session")
+def base_venv(shared_tmp_path):
     """
-    By default, all tests will run with the package as their working directory.
+    Provide the base virtual environment, holding the package toolchain,
+    created only once per session.
     """
 
-    with run_from(package.package):
-        yield
+    target = shared_tmp_path / "base"
+    ready = shared_tmp_path / "base.ready"
+
+    with locked(target):
+        if not ready.exists():
+            create_base_venv(target)
+            ready.touch()
+
+    return target / VENV_DIR
+
+
+@pytest.fixture(scope="session")
+def templates(shared_tmp_path, base_venv, worker_id):
+    """
+    Provide pristine packages, created only once per session for any given
+    context.
+
+    Yields a function which, given a context, returns the matching template
+    package, creating it first if needed. Templates are shared: read-only
+    consumers may use them directly, but must never modify them. Anything
+    which does gets a clone instead, via the package fixture.
+    """
+
+    cache = {}
+
+    def get_template(context):
+        key = tuple(sorted(context.items()))
+
+        if key not in cache:
+            name = f"template-{hashlib.sha256(repr(key).encode()).hexdigest()}"
+            target = shared_tmp_path / name
+            ready = shared_tmp_path / f"{name}.ready"
+
+            with locked(target):
+                if ready.exists():
+                    cache[key] = Package(
+                        package=target / PACKAGE_DIR,
+                        venv=target / VENV_DIR,
+                    )
+                else:
+                    cache[key] = create_package(
+                        target=target,
+                        base_venv=base_venv,
+                        **context,
+                    )
+                    ready.touch()
+
+        return cache[key]
+
+    yield get_template
+
+    if worker_id == "master":
+        for template in cache.values():
+            delete_package(template)
+
+
+@pytest.fixture
+def package(context, templates, tmp_path):
+    """
+    Create a new package, in a temporary directory, given the configuration
+    given by the "context" fixture. Once done, clean it up.
+
+    The package is a clone of the session-wide template for that context, so
+    the expensive creation steps only happen once.
+    """
+
+    package = clone_package(templates(context), tmp_path)
+    yield package
+    delete_package(package)
@@ -18,7 +18,7 @@ def test_bump_version(package):
     When checking the package version, we look into all the places we've told
     BumpVer to keep version information:
 
-    - setup.py, in the version field.
+    - pyproject.toml, in the project version field.
     - src/<package_slug>/__init__.py:__version__, for Python consumers.
     - VERSION, for non-Python consumers.
 
@@ -26,22 +26,22 @@ def test_bump_version(package):
     """
 
     old_meta = get_meta(package)
-    old_version = get_current_version()
-    old_license_year = get_license_year()
+    old_version = get_current_version(package)
+    old_license_year = get_license_year(package)
 
     assert old_version == "22.2.11"
     assert old_meta["version"] == "22.2.11"
     assert old_license_year == "2023"
 
-    run_cmd("bumpver", "update", "--patch", venv=package.venv)
+    run_cmd("bumpver", "update", "--patch", venv=package.venv, cwd=package.package)
 
     bumpver_info = get_bumpver_info(package)
     bumpver_year = bumpver_info["YEAR_Y"]
     bumpver_version = bumpver_info["CURRENT_VERSION"]
 
     new_meta = get_meta(package)
-    new_version = get_current_version()
-    new_license_year = get_license_year()
+    new_version = get_current_version(package)
+    new_license_year = get_license_year(package)
 
     assert new_version == bumpver_version
     assert new_meta["version"] == bumpver_version
@@ -1,69 +1,215 @@
+import dataclasses
+import json
+import os
+import pathlib
+import stat
+
 import pytest
 
 from .. import get_dependencies, get_meta
 
 
+@dataclasses.dataclass(frozen=True)
+class Variant:
+    """
+    A package variant: the context it's created from, on top of the default
+    one, and what we expect it to include.
+    """
+
+    context: dict
+    files: frozenset
+    install_requires: tuple
+    dev_extras: tuple
+
+
+EXPECTED_FILES = json.loads(
+    pathlib.Path(__file__).with_name("expected_files.json").read_text(encoding="utf-8")
+)
+"""
+Files expected in generated packages. Every variant includes the "base" files,
+plus its own.
+"""
+
+BASE_FILES = frozenset(EXPECTED_FILES["base"])
+
+BASE_INSTALL_REQUIRES = (
+    "attrs>=20.2",
+    "zope.interface>=5.0",
+    "mypy-zope>=0.3.3",
+)
+
+BASE_DEV_EXTRAS = (
+    "bandit",
+    "bumpver>=2021.1109",
+    "black>=22.1",
+    "coverage[toml]>=5.0",
+    "flake8",
+    "flake8-bugbear",
+    "hypothesis>=6.0",
+    "isort>=5.0",
+    "mypy>=0.920",
+    "pdbpp",
+    "pip-audit",
+    "pylint",
+    "pytest>=6.0",
+    "pytest-cov>=3.0",
+    "tox",
+)
+
+VARIANTS = {
+    "base": Variant(
+        context={},
+        files=BASE_FILES,
+        install_requires=BASE_INSTALL_REQUIRES,
+        dev_extras=BASE_DEV_EXTRAS,
+    ),
+    "db": Variant(
+        context={"use_db": "y"},
+        files=BASE_FILES | frozenset(EXPECTED_FILES["db"]),
+        install_requires=(
+            *BASE_INSTALL_REQUIRES,
+            "alembic>=1.7",
+            "psycopg2-binary",
+            "sqlalchemy[mypy]>=2.0",
+        ),
+        dev_extras=BASE_DEV_EXTRAS,
+    ),
+    "trio": Variant(
+        context={"use_trio": "y"},
+        files=BASE_FILES | frozenset(EXPECTED_FILES["trio"]),
+        install_requires=(
+            *BASE_INSTALL_REQUIRES,
+            "trio>=0.19",
+            "trio-typing>=0.7",
+        ),
+        dev_extras=(
+            *BASE_DEV_EXTRAS,
+            "pytest-trio>=0.7",
+        ),
+    ),
+}
+"""
+Package variants under test, by name.
+"""
+
+
+@pytest.fixture
+def variant(request):
+    """
+    The package variant under test. Tests are parametrized with its name,
+    indirectly.
+    """
+
+    return VARIANTS[request.param]
+
+
+@pytest.fixture
+def context(context, variant):
+    return {
+        **context,
+        **variant.context,
+    }
+
+
+@pytest.fixture
+def package(context, templates):
+    """
+    Package generation checks never modify the package, so there's no need
+    for a clone: use the session-wide template for the context directly.
+    """
+
+    return templates(context)
+
+
+@pytest.mark.parametrize(
+    "variant",
+    [pytest.param(name, marks=pytest.mark.xdist_group(name)) for name in VARIANTS],
+    indirect=True,
+)
 class TestPackageGeneration:
     """
     Class to encapsulate package generation checks.
 
     It's a bit funny-looking, but there's a reason for that. They way the test
-    suite is structured, the "package" fixture, which creates a new Cookiecut
-    Python package, is function-scoped. This means each test function has its
-    very own Package, so they are free to perform, whichever workflows they
-    happen to be testing.
-
-    Package generation needs to check quite a few things. We could check them
-    in separate test functions, but that would mean a mean amount of packages
-    being created, slowing the whole things down. We could mess with different
-    fixture scopes, but that almost invariably ends up looking nasty. Instead,
-    we isolate the checks in non-test methods, and just call them, one after
-    the other, in the actual test.
-
-    A good side effect of this structure is that we can sub-class, to create
-    different package variations, and only override the checks which are
-    actually different.
+    suite is structured, the "package" fixture hands each test function its
+    very own clone of a Cookiecut Python package, so they are free to perform,
+    whichever workflows they happen to be testing. Generation checks are
+    read-only, so here the fixture is overridden to hand out the session-wide
+    template for the context instead, which is created only once.
+
+    Package generation needs to check quite a few things. We isolate the checks
+    in non-test methods, and just call them, one after the other, in the
+    actual test.
+
+    The whole class is parametrized by package variant. Checks which differ
+    from one variant to the next take the variant, and compare against what it
+    expects. Each variant is its own xdist group, so variants are spread
+    across workers, and their templates are built in parallel.
     """
 
-    FILES = (
-        ".editorconfig",
-        ".flake8",
-        ".gitignore",
-        ".license-whitelist",
-        ".vscode/settings.json",
-        "LICENSE",
-        "pyproject.toml",
-        "Rakefile",
-        "setup.py",
-        "tox.ini",
-        "VERSION",
-        "requirements/requirements.txt",
-        "requirements/dev.txt",
-        "scripts/gen_requirements.sh",
-        "scripts/run_audit.sh",
-        "scripts/run_license_check.sh",
-        "scripts/update_requirements.sh",
-        "src/test_package/__init__.py",
-        "tests/test_void.py",
-    )
-    """
-    File list we expect the package to include.
-    """
+    def stat_file(self, file_path):
+        """
+        Stat a file, failing the test if it does not exist.
+
+        A single stat() call answers whether the file exists, what kind of file
+        it is, and its size.
+
+        Args:
+            file_path (pathlib.Path): The file to stat.
+        Returns:
+            os.stat_result: The file status.
+        """
+
+        try:
+            return os.stat(file_path)
+        except FileNotFoundError:
+            pytest.fail(f"{file_path} does not exist")
+
+    def list_files(self, root):
+        """
+        List all the regular files under a directory, recursively.
+
+        The whole tree is walked once, with os.scandir(), which gets the file
+        types along with the directory entries, instead of looking up every
+        expected file on its own.
+
+        Args:
+            root (pathlib.Path): The directory to list.
+        Returns:
+            set[str]: Paths of the files found, relative to root.
+        """
+
+        files = set()
+        pending = [""]
+
+        while pending:
+            directory = pending.pop()
+
+            with os.scandir(root / directory) as entries:
+                for entry in entries:
+                    path = os.path.join(directory, entry.name)
 
-    def check_files(self, package):
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(path)
+                    elif entry.is_file():
+                        files.add(path)
+
+        return files
+
+    def check_files(self, package, variant):
         """
-        Check all the files listed in self.FILES exist, and are regular files.
+        Check all the files the variant expects exist, and are regular files.
 
         Args:
             package (Package): The package to check.
+            variant (Variant): The package variant.
         Raises:
             AssertionError: If the files do not exist, or are not files.
         """
 
-        for file in self.FILES:
-            file_path = package.package / file
+        missing = variant.files - self.list_files(package.package)
 
-            assert file_path.exists() and file_path.is_file()
+        assert not missing, f"Missing files: {sorted(missing)}"
 
     def check_bootstrap(self, package):
         """
@@ -82,12 +228,12 @@ class TestPackageGeneration:
 
     def check_meta(self, package):
         """
-        Check the setup.py information matches the context provided.
+        Check the project information matches the context provided.
 
         Args:
             package (Package): The package to check.
         Raises:
-            AssertionError: If the setup.py information does not match.
+            AssertionError: If the project information does not match.
         """
 
         meta = get_meta(package)
@@ -99,45 +245,29 @@ class TestPackageGeneration:
             "author_email": "johndoe@domain.tld",
         }
 
-    def check_dependencies(self, package):
+    def check_dependencies(self, package, variant):
         """
-        Check the setup.py dependency information matches what we expect.
+        Check the project dependency information matches what the variant
+        expects. Order is not significant, so dependencies are compared as
+        sets.
 
         Args:
             package (Package): The package to check.
+            variant (Variant): The package variant.
         Raises:
-            AssertionError: If the setup.py dependencies do not match.
+            AssertionError: If the project dependencies do not match.
         """
 
         dependencies = get_dependencies(package)
 
-        assert dependencies == {
-            "install": [
-                "attrs>=20.2",
-                "zope.interface>=5.0",
-                "mypy-zope>=0.3.3",
-            ],
-            "extras": {
-                "dev": [
-                    "bandit",
-                    "bumpver>=2021.1109",
-                    "black>=22.1",
-                    "coverage[toml]>=5.0",
-                    "flake8",
-                    "flake8-bugbear",
-                    "hypothesis>=6.0",
-                    "isort>=5.0",
-                    "mypy>=0.920",
-                    "pdbpp",
-                    "pip-audit",
-                    "pylint",
-                    "pytest>=6.0",
-                    "pytest-cov>=3.0",
-                    "tox",
-                ],
-            },
+        install = frozenset(dependencies["install"])
+        extras = {
+            name: frozenset(extra) for name, extra in dependencies["extras"].items()
         }
 
+        assert install == frozenset(variant.install_requires)
+        assert extras == {"dev": frozenset(variant.dev_extras)}
+
     def check_requirements_files(self, package):
         """
         Check the pinned requirements files, created by pip-tools, exist and
@@ -155,126 +285,13 @@ class TestPackageGeneration:
         )
 
         for file in requirements_files:
-            assert file.exists() and file.is_file() and file.stat().st_size > 0
+            file_stat = self.stat_file(file)
 
-    def test_generated_package(self, package):
-        self.check_files(package)
+            assert stat.S_ISREG(file_stat.st_mode) and file_stat.st_size > 0
+
+    def test_generated_package(self, package, variant):
+        self.check_files(package, variant)
         self.check_bootstrap(package)
         self.check_meta(package)
-        self.check_dependencies(package)
+        self.check_dependencies(package, variant)
         self.check_requirements_files(package)
-
-
-class TestDBPackageGeneration(TestPackageGeneration):
-    FILES = (
-        *TestPackageGeneration.FILES,
-        "alembic.ini",
-        "alembic/README",
-        "alembic/env.py",
-        "alembic/script.py.mako",
-        "alembic/versions/.gitkeep",
-        "src/test_package/models.py",
-    )
-    """
-    File list we expect the package to include.
-    """
-
-    @pytest.fixture
-    def context(self, context):
-        """
-        Create a DB-enabled package.
-        """
-
-        return {
-            **context,
-            "use_db": "y",
-        }
-
-    def check_dependencies(self, package):
-        """
-        The dependency check is different, as it needs to include DB-specific
-        packages.
-        """
-
-        dependencies = get_dependencies(package)
-
-        assert dependencies == {
-            "install": [
-                "attrs>=20.2",
-                "zope.interface>=5.0",
-                "mypy-zope>=0.3.3",
-                "alembic>=1.7",
-                "psycopg2-binary",
-                "sqlalchemy[mypy]>=2.0",
-            ],
-            "extras": {
-                "dev": [
-                    "bandit",
-                    "bumpver>=2021.1109",
-                    "black>=22.1",
-                    "coverage[toml]>=5.0",
-                    "flake8",
-                    "flake8-bugbear",
-                    "hypothesis>=6.0",
-                    "isort>=5.0",
-                    "mypy>=0.920",
-                    "pdbpp",
-                    "pip-audit",
-                    "pylint",
-                    "pytest>=6.0",
-                    "pytest-cov>=3.0",
-                    "tox",
-                ],
-            },
-        }
-
-
-class TestTrioPackageGeneration(TestPackageGeneration):
-    @pytest.fixture
-    def context(self, context):
-        """
-        Create an async-enabled package.
-        """
-
-        return {
-            **context,
-            "use_trio": "y",
-        }
-
-    def check_dependencies(self, package):
-        """
-        The dependency check is different, as it needs to include Trio-specific
-        packages.
-        """
-
-        dependencies = get_dependencies(package)
-
-        assert dependencies == {
-            "install": [
-                "attrs>=20.2",
-                "zope.interface>=5.0",
-                "mypy-zope>=0.3.3",
-                "trio>=0.19",
-                "trio-typing>=0.7",
-            ],
-            "extras": {
-                "dev": [
-                    "bandit",
-                    "bumpver>=2021.1109",
-                    "black>=22.1",
-                    "coverage[toml]>=5.0",
-                    "flake8",
-                    "flake8-bugbear",
-                    "hypothesis>=6.0",
-                    "isort>=5.0",
-                    "mypy>=0.920",
-                    "pdbpp",
-                    "pip-audit",
-                    "pylint",
-                    "pytest>=6.0",
-                    "pytest-cov>=3.0",
-                    "tox",
-                    "pytest-trio>=0.7",
-                ],
-            },
-        }
@@ -1,17 +1,40 @@
+import dataclasses
+import re
+import shutil
 import subprocess
 
 import pytest
 
 from .. import (
+    PACKAGE_DIR,
     add_and_install_dependency,
+    clone_package,
+    delete_package,
+    delete_tree,
     run_cmd,
-    run_from,
     update_and_install_dependency,
 )
 
+pytestmark = pytest.mark.xdist_group("vulnerabilities")
+"""
+Module fixtures are built once per worker: keep every test in this module on
+the same one, so the vulnerable package is only built once.
+"""
+
+AUDIT_FINDINGS = frozenset(
+    {
+        "cryptography",  # Vulnerable package.
+        "PYSEC-2021-63",  # Vulnerability ID.
+        "GHSA-x4qr-2fvf-3mr5",  # Vulnerability ID.
+        "GHSA-w7pp-m8wf-vj6r",  # Vulnerability ID.
+        "3.3.2",  # Fix version.
+    }
+)
+AUDIT_FINDINGS_RE = re.compile("|".join(map(re.escape, sorted(AUDIT_FINDINGS))))
 
-@pytest.fixture
-def package(package):
+
+@pytest.fixture(scope="module")
+def vulnerable_package(context, templates, tmp_path_factory):
     """
     cryptography<3.3.2 contains this vulnerability IDs:
 
@@ -24,15 +47,70 @@ def package(package):
 
     - CVE-2023-23931
     - GHSA-w7pp-m8wf-vj6r
+
+    Installing it is expensive, so it's done only once for the whole module,
+    and tests get a clone, via the "package" fixture.
+    """
+
+    target = tmp_path_factory.mktemp("vulnerable")
+    package = clone_package(templates(context), target)
+
+    add_and_install_dependency("cryptography==3.3.1", package)
+
+    yield package
+
+    delete_package(package)
+
+
+@pytest.fixture(scope="module")
+def initial_audit(vulnerable_package):
+    """
+    Run the pip-audit script on the vulnerable package, before anything else
+    happens to it. It should fail, pointing at the vulnerability.
+
+    Every test starts from the same state, so the audit is only run once for
+    the whole module.
+    """
+
+    with pytest.raises(subprocess.CalledProcessError) as error:
+        run_cmd(
+            "./scripts/run_audit.sh",
+            venv=vulnerable_package.venv,
+            cwd=vulnerable_package.package,
+        )
+
+    return error.value
+
+
+@pytest.fixture
+def package(vulnerable_package, tmp_path):
+    package = clone_package(vulnerable_package, tmp_path)
+    yield package
+    delete_package(package)
+
+
+@pytest.fixture
+def shared_venv_package(vulnerable_package, tmp_path):
+    """
+    Copy of the vulnerable package which shares its virtual environment.
+
+    The audit only reads the pinned requirements from the package directory, so
+    tests which leave the virtual environment alone can skip cloning it.
     """
 
-    with run_from(package.package):
-        add_and_install_dependency("cryptography==3.3.1", package)
+    package = dataclasses.replace(
+        vulnerable_package,
+        package=tmp_path / PACKAGE_DIR,
+    )
+
+    shutil.copytree(vulnerable_package.package, package.package, symlinks=True)
 
     yield package
 
+    delete_tree(package.package)
+
 
-def test_update_vulnerable_package(package):
+def test_update_vulnerable_package(package, initial_audit):
     """
     Workflow under test:
 
@@ -45,23 +123,17 @@ def test_update_vulnerable_package(package):
     Keep in mind the way this workflow has been implemented differs a little
     bit from what it would look like in practice. Since installing a vulnerable
     package can be challenging, we force a specific version via an exact
-    version specifier in setup.py. This would not happen in reality, as the
-    vulnerable version would just be in the pinned requirements (remember using
-    exact version specifiers in setup.py tends to be frowned upon, as it can
-    complicate deployment). In any real-world setting we'd just run the
-    dependency upgrade script (scripts/update_requirements.sh), and pip-sync.
+    version specifier in pyproject.toml. This would not happen in reality, as
+    the vulnerable version would just be in the pinned requirements (remember
+    using exact version specifiers in package dependencies tends to be frowned
+    upon, as it can complicate deployment). In any real-world setting we'd just
+    run the dependency upgrade script (scripts/update_requirements.sh), and
+    pip-sync.
     """
 
-    with pytest.raises(subprocess.CalledProcessError) as error:
-        run_cmd("./scripts/run_audit.sh", venv=package.venv)
-
-    assert error.value.returncode == 1
+    assert initial_audit.returncode == 1
 
-    assert b"cryptography" in error.value.stdout  # Vulnerable package.
-    assert b"PYSEC-2021-63" in error.value.stdout  # Vulnerability ID.
-    assert b"GHSA-x4qr-2fvf-3mr5" in error.value.stdout  # Vulnerability ID.
-    assert b"GHSA-w7pp-m8wf-vj6r" in error.value.stdout  # Vulnerability ID.
-    assert b"3.3.2" in error.value.stdout  # Fix version.
+    assert set(AUDIT_FINDINGS_RE.findall(initial_audit.stdout)) >= AUDIT_FINDINGS
 
     update_and_install_dependency(
         "cryptography==3.3.1",
@@ -69,13 +141,13 @@ def test_update_vulnerable_package(package):
         package,
     )
 
-    result = run_cmd("./scripts/run_audit.sh", venv=package.venv)
+    result = run_cmd("./scripts/run_audit.sh", venv=package.venv, cwd=package.package)
 
     assert result.returncode == 0
 
 
 @pytest.mark.xfail(reason="pip-audit seems to have changed return codes")
-def test_ignore_vulnerable_package(package):
+def test_ignore_vulnerable_package(shared_venv_package, initial_audit):
     """
     Workflow under test:
 
@@ -86,24 +158,20 @@ def test_ignore_vulnerable_package(package):
       vulnerabilities.
     """
 
-    with pytest.raises(subprocess.CalledProcessError) as error:
-        run_cmd("./scripts/run_audit.sh", venv=package.venv)
-
-    assert error.value.returncode == 1
+    assert initial_audit.returncode == 1
 
-    assert b"cryptography" in error.value.stdout  # Vulnerable package.
-    assert b"PYSEC-2021-63" in error.value.stdout  # Vulnerability ID.
-    assert b"GHSA-x4qr-2fvf-3mr5" in error.value.stdout  # Vulnerability ID.
-    assert b"GHSA-w7pp-m8wf-vj6r" in error.value.stdout  # Vulnerability ID.
-    assert b"3.3.2" in error.value.stdout  # Fix version.
+    assert set(AUDIT_FINDINGS_RE.findall(initial_audit.stdout)) >= AUDIT_FINDINGS
 
-    with open(".audit-ignore", "w") as f:
-        f.write("PYSEC-2021-63\n")
-        f.write("GHSA-x4qr-2fvf-3mr5\n")
-        f.write("GHSA-w7pp-m8wf-vj6r\n")
+    (shared_venv_package.package / ".audit-ignore").write_text(
+        "PYSEC-2021-63\nGHSA-x4qr-2fvf-3mr5\nGHSA-w7pp-m8wf-vj6r\n"
+    )
 
-    run_cmd("./scripts/run_audit.sh", venv=package.venv)
+    result = run_cmd(
+        "./scripts/run_audit.sh",
+        venv=shared_venv_package.venv,
+        cwd=shared_venv_package.package,
+    )
 
-    assert b"PYSEC-2021-63" not in error.value.stdout
-    assert b"GHSA-x4qr-2fvf-3mr5" not in error.value.stdout
-    assert b"GHSA-w7pp-m8wf-vj6r" not in error.value.stdout
+    assert "PYSEC-2021-63" not in result.stdout
+    assert "GHSA-x4qr-2fvf-3mr5" not in result.stdout
+    assert "GHSA-w7pp-m8wf-vj6r" not in result.stdout
@@ -7,9 +7,9 @@ PIP_COMPILE_ARGS="--no-header --generate-hashes --allow-unsafe"
 PIP_COMPILE_EXTRAS="dev"
 
 
-pip-compile ${PIP_COMPILE_ARGS} --output-file "${REQUIREMENTS_DIR}/requirements.txt"
+pip-compile ${PIP_COMPILE_ARGS} --output-file "${REQUIREMENTS_DIR}/requirements.txt" pyproject.toml
 
 for EXTRA in ${PIP_COMPILE_EXTRAS}
 do
-    pip-compile ${PIP_COMPILE_ARGS} --extra "${EXTRA}" --output-file "${REQUIREMENTS_DIR}/${EXTRA}.txt"
+    pip-compile ${PIP_COMPILE_ARGS} --extra "${EXTRA}" --output-file "${REQUIREMENTS_DIR}/${EXTRA}.txt" pyproject.toml
 done
@@ -24,9 +24,9 @@ PIP_COMPILE_ARGS="--no-header --generate-hashes --allow-unsafe ${PIP_COMPILE_UPG
 PIP_COMPILE_EXTRAS="dev"
 
 
-echo "${PIP_COMPILE_ARGS}" | xargs pip-compile --output-file "${REQUIREMENTS_DIR}/requirements.txt"
+echo "${PIP_COMPILE_ARGS}" | xargs pip-compile --output-file "${REQUIREMENTS_DIR}/requirements.txt" pyproject.toml
 
 for EXTRA in ${PIP_COMPILE_EXTRAS}
 do
-    echo "${PIP_COMPILE_ARGS}" | xargs pip-compile --extra "${EXTRA}" --output-file "${REQUIREMENTS_DIR}/${EXTRA}.txt"
+    echo "${PIP_COMPILE_ARGS}" | xargs pip-compile --extra "${EXTRA}" --output-file "${REQUIREMENTS_DIR}/${EXTRA}.txt" pyproject.toml
 done
@@ -1,37 +1,46 @@
+import datetime
+from typing import Optional
+
 from sqlalchemy import types
 from sqlalchemy.orm import (
-    declarative_base,
-    declarative_mixin,
+    DeclarativeBase,
+    Mapped,
+    MappedAsDataclass,
     declared_attr,
     mapped_column,
 )
 from sqlalchemy.schema import MetaData
 from sqlalchemy.sql import functions
 
+_NAMING_CONVENTION = {
+    "ix": "ix_%(column_0_label)s",
+    "uq": "uq_%(table_name)s_%(column_0_name)s",
+    "ck": "ck_%(table_name)s_%(constraint_name)s",
+    "fk": "fk_%(table_name)s_%(column_0_name)s_%(referred_table_name)s",
+    "pk": "pk_%(table_name)s",
+}
 
-class _Base:
-    # pylint: disable=no-member,no-self-argument
+_METADATA = MetaData(naming_convention=_NAMING_CONVENTION)
 
-    @declared_attr
-    def __tablename__(cls):
-        return cls.__name__.lower()
 
+class Base(MappedAsDataclass, DeclarativeBase):
+    # pylint: disable=no-member,no-self-argument
 
-Base = declarative_base(
-    cls=_Base,
-    metadata=MetaData(
-        naming_convention={
-            "ix": "ix_%(column_0_label)s",
-            "uq": "uq_%(table_name)s_%(column_0_name)s",
-            "ck": "ck_%(table_name)s_%(constraint_name)s",
-            "fk": "fk_%(table_name)s_%(column_0_name)s_%(referred_table_name)s",
-            "pk": "pk_%(table_name)s",
-        },
-    ),
-)
+    metadata = _METADATA
+
+    @declared_attr.directive
+    def __tablename__(cls) -> str:
+        return cls.__name__.lower()
 
 
-@declarative_mixin
-class Timestamped:
-    created = mapped_column(types.DateTime, default=functions.now())
-    modified = mapped_column(types.DateTime, onupdate=functions.now())
+class Timestamped(MappedAsDataclass):
+    created: Mapped[Optional[datetime.datetime]] = mapped_column(
+        types.DateTime,
+        init=False,
+        server_default=functions.now(),
+    )
+    modified: Mapped[Optional[datetime.datetime]] = mapped_column(
+        types.DateTime,
+        init=False,
+        onupdate=functions.now(),
+    )